@@ -1,15 +1,20 @@
 from flask import (
     Flask,
     render_template,
-    render_template_string,
     redirect,
     url_for,
     request,
     flash,
     session,
+    g,
     jsonify,
 )
+from flask_caching import Cache
+from flask_limiter import Limiter
+from flask_limiter.util import get_remote_address
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import case, event, func
+from sqlalchemy.engine import Engine
 from flask_login import (
     LoginManager,
     login_user,
@@ -18,13 +23,26 @@ from flask_login import (
     UserMixin,
     current_user,
 )
-from werkzeug.security import generate_password_hash, check_password_hash
+from passlib.hash import bcrypt
+from werkzeug.security import check_password_hash
 from werkzeug.utils import secure_filename
 import os
 import random
+import re
 import datetime
-import uuid
-import base64
+import hashlib
+import secrets
+import shutil
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+try:
+    # SIMD-accelerated decoder; same API as the stdlib module
+    import pybase64 as base64
+except ImportError:
+    import base64
 
 # --- App setup ---
 app = Flask(__name__)
@@ -32,6 +50,14 @@ app.config["SECRET_KEY"] = "your-secret-key"
 # SQLite database file will be created in project root
 app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///grinapay.db"
 app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+# keep SQLite connections open between requests instead of reopening the file
+app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+    "pool_size": 10,
+    "max_overflow": 20,
+    "pool_pre_ping": True,
+    # "timeout" is sqlite3's busy handler; don't also set PRAGMA busy_timeout
+    "connect_args": {"check_same_thread": False, "timeout": 30},
+}
 
 # Limit request size (helps avoid "Request Entity Too Large")
 # 16 MB here — tune as needed
@@ -45,11 +71,60 @@ os.makedirs(os.path.join(app.config["UPLOAD_FOLDER"], "selfies"), exist_ok=True)
 
 # Allowed file extensions for uploads
 ALLOWED_EXTENSIONS = {"png", "jpg", "jpeg", "gif"}
+_ALLOWED_RE = re.compile(
+    r"\.(?:%s)\Z" % "|".join(re.escape(ext) for ext in sorted(ALLOWED_EXTENSIONS)), re.IGNORECASE
+)
+
+# Static option lists for the betting and internet pages
+BETTING_COMPANIES = (
+    "Bet9ja", "NairaBet", "SportyBet", "BetKing", "MerryBet",
+    "1xBet", "SureBet247", "AccessBet", "BetWay", "LivescoreBet",
+)
+INTERNET_PROVIDERS = ("MTN", "GLO", "AIRTEL", "ETISALAT")
+# trailing price in a bundle label such as "1GB – ₦1,500"
+_AMOUNT_RE = re.compile(r"(\d[\d,]*(?:\.\d+)?)\s*$")
+
+# write buffer for saving uploads (werkzeug's default copy uses 16 KB chunks)
+UPLOAD_BUFFER_SIZE = 1 << 20
+
+# base64 chars decoded per slice when saving camera selfies (must be a multiple of 4)
+SELFIE_DECODE_CHUNK = 64 * 1024
+_NON_BASE64_RE = re.compile(r"[^A-Za-z0-9+/=]")
+
+# bcrypt cost factor — 12 rounds is ~50-100ms per verify on typical hosts,
+# recalibrate on the deployment machine if login latency drifts
+BCRYPT_ROUNDS = 12
+
+# Short-lived cache of password verification results so repeated logins
+# don't pay the full bcrypt cost every time
+VERIFY_CACHE_SIZE = 4096
+VERIFY_CACHE_TTL = 60  # seconds
 
 db = SQLAlchemy(app)
+
+
+@event.listens_for(Engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    # WAL lets dashboard/transaction reads run alongside writes
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
+
 login_manager = LoginManager(app)
 login_manager.login_view = "login"
 
+# caps how much bcrypt work a single client can trigger on login/signup
+limiter = Limiter(get_remote_address, app=app, storage_uri="memory://")
+
+# in-process cache for dashboard figures that only change when a transaction is written
+cache = Cache(app, config={"CACHE_TYPE": "SimpleCache"})
+
 
 # --- Database models ---
 class User(UserMixin, db.Model):
@@ -71,8 +146,23 @@ class User(UserMixin, db.Model):
     # Personal info for merchants
     company_name = db.Column(db.String(150))
 
-    # Relationship with transactions
-    transactions = db.relationship("Transaction", backref="user", lazy=True)
+    # Relationship with transactions. Lazy loading raises so nothing silently
+    # pulls a user's whole history; use current_balance() or an explicit
+    # selectinload(User.transactions) instead.
+    transactions = db.relationship("Transaction", back_populates="user", lazy="raise")
+
+    @property
+    def profile_pic_url(self):
+        # memoised on flask.g so url_for runs at most once per request
+        urls = g.setdefault("_profile_pic_urls", {})
+        if self.profile_pic not in urls:
+            urls[self.profile_pic] = url_for("static", filename=self.profile_pic)
+        return urls[self.profile_pic]
+
+
+# emails are stored lower-cased; this keeps case-insensitive lookups indexed
+# for rows written before that normalisation
+db.Index("ix_user_email_lower", func.lower(User.email), unique=True)
 
 
 class Transaction(db.Model):
@@ -83,27 +173,118 @@ class Transaction(db.Model):
     date = db.Column(db.DateTime, default=datetime.datetime.utcnow)
     description = db.Column(db.String(200), nullable=True)
 
+    user = db.relationship("User", back_populates="transactions")
+
+    __table_args__ = (
+        # dashboard/history ordering and the balance aggregate both filter by user first
+        db.Index("ix_txn_user_date", "user_id", "date"),
+        db.Index("ix_txn_user_type", "user_id", "txn_type"),
+    )
+
 
 @login_manager.user_loader
 def load_user(user_id):
-    return User.query.get(int(user_id))
+    return db.session.get(User, int(user_id))
+
+
+def current_balance(user_id):
+    """
+    Sum the user's transactions in SQL: deposits count in, everything else
+    (withdrawals, transfers, betting, data) counts out.
+    """
+    return (
+        db.session.query(
+            func.coalesce(
+                func.sum(case((Transaction.txn_type == "Deposit", Transaction.amount), else_=-Transaction.amount)),
+                0.0,
+            )
+        )
+        .filter(Transaction.user_id == user_id)
+        .scalar()
+    )
+
+
+@cache.memoize(timeout=30)
+def cached_balance(user_id):
+    """
+    current_balance() cached for the dashboard. Anything that checks funds
+    before moving money should call current_balance() directly.
+    """
+    return current_balance(user_id)
+
+
+def invalidate_balance(*user_ids):
+    for user_id in user_ids:
+        cache.delete_memoized(cached_balance, user_id)
+
+
+def hash_password(raw_password):
+    return bcrypt.using(rounds=BCRYPT_ROUNDS).hash(raw_password)
+
+
+def verify_password(password_hash, raw_password):
+    """
+    Check raw_password against a stored hash.
+    Accounts created before the switch to bcrypt still carry werkzeug
+    PBKDF2/scrypt hashes, so fall back to werkzeug for those.
+    """
+    if not password_hash or not raw_password:
+        return False
+    if bcrypt.identify(password_hash):
+        return bcrypt.verify(raw_password, password_hash)
+    return check_password_hash(password_hash, raw_password)
+
+
+# process-wide salt so cache keys never hold a plain sha256 of a password
+_verify_cache_salt = secrets.token_bytes(16)
+_verify_cache = OrderedDict()
+_verify_cache_lock = threading.Lock()
+
+
+def verify_cached(user, raw_password):
+    """
+    Same as verify_password() but remembers the result for VERIFY_CACHE_TTL seconds.
+    The stored hash is part of the key, so a password change invalidates old entries.
+    """
+    if not raw_password:
+        return False
+    key = (
+        user.id,
+        hashlib.sha256(_verify_cache_salt + user.password.encode() + b"\0" + raw_password.encode()).digest(),
+    )
+    now = time.monotonic()
+    with _verify_cache_lock:
+        hit = _verify_cache.get(key)
+        if hit is not None and hit[1] > now:
+            _verify_cache.move_to_end(key)
+            return hit[0]
+
+    ok = verify_password(user.password, raw_password)
+
+    with _verify_cache_lock:
+        _verify_cache[key] = (ok, now + VERIFY_CACHE_TTL)
+        _verify_cache.move_to_end(key)
+        while len(_verify_cache) > VERIFY_CACHE_SIZE:
+            _verify_cache.popitem(last=False)
+    return ok
 
 
 def allowed_file(filename):
-    return "." in filename and filename.rsplit(".", 1)[1].lower() in ALLOWED_EXTENSIONS
+    return bool(_ALLOWED_RE.search(filename))
 
 
-def save_file_get_static_path(file_storage):
+def save_file_get_static_path(file_storage, subfolder=""):
     """
-    Save an uploaded FileStorage to the UPLOAD_FOLDER with a unique filename.
+    Save an uploaded FileStorage to the UPLOAD_FOLDER (or a subfolder of it) with a unique filename.
     Return the path relative to static/ (e.g. "uploads/uniqname.jpg") or None.
     """
     if file_storage and getattr(file_storage, "filename", None) and allowed_file(file_storage.filename):
         filename = secure_filename(file_storage.filename)
-        unique_name = f"{uuid.uuid4().hex}_{filename}"
-        dest = os.path.join(app.config["UPLOAD_FOLDER"], unique_name)
-        file_storage.save(dest)
-        return os.path.join("uploads", unique_name)
+        unique_name = f"{secrets.token_hex(16)}_{filename}"
+        dest = os.path.join(app.config["UPLOAD_FOLDER"], subfolder, unique_name)
+        with open(dest, "wb", buffering=UPLOAD_BUFFER_SIZE) as f:
+            shutil.copyfileobj(file_storage.stream, f, length=UPLOAD_BUFFER_SIZE)
+        return os.path.join("uploads", subfolder, unique_name)
     return None
 
 
@@ -130,20 +311,23 @@ def save_base64_selfie_get_static_path(data_url):
     else:
         ext = "png"  # fallback
 
-    try:
-        img_bytes = base64.b64decode(encoded)
-    except Exception:
-        return None
-
-    filename = f"selfie_{uuid.uuid4().hex}.{ext}"
+    filename = f"selfie_{secrets.token_hex(16)}.{ext}"
+    # selfies folder is created once at startup (see app setup)
     selfies_folder = os.path.join(app.config["UPLOAD_FOLDER"], "selfies")
-    os.makedirs(selfies_folder, exist_ok=True)
     full_path = os.path.join(selfies_folder, filename)
 
+    # drop whitespace/newlines etc. first: slicing assumes every char is base64,
+    # otherwise the 4-char alignment of later slices shifts
+    encoded = _NON_BASE64_RE.sub("", encoded)
+
+    # decode in slices so we never hold the whole decoded image alongside the payload
     try:
-        with open(full_path, "wb") as f:
-            f.write(img_bytes)
+        with open(full_path, "wb", buffering=UPLOAD_BUFFER_SIZE) as f:
+            for start in range(0, len(encoded), SELFIE_DECODE_CHUNK):
+                f.write(base64.b64decode(encoded[start:start + SELFIE_DECODE_CHUNK], validate=False))
     except Exception:
+        if os.path.exists(full_path):
+            os.remove(full_path)
         return None
 
     return os.path.join("uploads", "selfies", filename)
@@ -158,10 +342,11 @@ def home():
 
 
 @app.route("/signup", methods=["GET", "POST"])
+@limiter.limit("5/minute", methods=["POST"])
 def signup():
     if request.method == "POST":
         account_type = request.form.get("account_type") or "user"
-        email = request.form.get("email")
+        email = request.form.get("email", "").strip().lower()
         raw_password = request.form.get("password")
         confirm_password = request.form.get("confirm_password")
 
@@ -175,18 +360,22 @@ def signup():
             return redirect(url_for("signup"))
 
         # duplicate email check
-        if User.query.filter_by(email=email).first():
+        if User.query.filter(func.lower(User.email) == email).first():
             flash("Email already registered!", "danger")
             return redirect(url_for("signup"))
 
         # create password hash and account number
-        password = generate_password_hash(raw_password)
+        password = hash_password(raw_password)
         account_number = str(random.randint(100000000000, 999999999999))
 
         # First try to save a file upload for profile_pic (if user used file input)
         profile_pic_path = save_file_get_static_path(request.files.get("profile_pic"))
 
-        # Next, if a base64 selfie was provided via hidden input (from camera), save it and use as profile pic
+        # Next, if the camera selfie was posted as a file part, save it and use as profile pic
+        if not profile_pic_path:
+            profile_pic_path = save_file_get_static_path(request.files.get("selfie"), "selfies")
+
+        # Older clients still send the selfie as a base64 data URL in a form field
         selfie_data = request.form.get("selfie")
         if not profile_pic_path and selfie_data:
             selfie_saved = save_base64_selfie_get_static_path(selfie_data)
@@ -225,11 +414,11 @@ def signup():
             flash("Invalid account type!", "danger")
             return redirect(url_for("signup"))
 
-        # Save user
+        # Save user (flush only, to get new_user.id without a separate commit)
         db.session.add(new_user)
-        db.session.commit()
+        db.session.flush()
 
-        # Add a welcome deposit transaction
+        # Add a welcome deposit transaction in the same commit as the user
         welcome_txn = Transaction(
             user_id=new_user.id,
             txn_type="Deposit",
@@ -246,13 +435,14 @@ def signup():
 
 
 @app.route("/login", methods=["GET", "POST"])
+@limiter.limit("5/minute", methods=["POST"])
 def login():
     if request.method == "POST":
-        email = request.form.get("email")
+        email = request.form.get("email", "").strip().lower()
         password = request.form.get("password")
         remember = True if request.form.get("remember") == "on" else False
-        user = User.query.filter_by(email=email).first()
-        if user and check_password_hash(user.password, password):
+        user = User.query.filter(func.lower(User.email) == email).first()
+        if user and verify_cached(user, password):
             login_user(user, remember=remember)
             return redirect(url_for("dashboard"))
         flash("Invalid credentials!", "danger")
@@ -262,36 +452,34 @@ def login():
 @app.route("/dashboard")
 @login_required
 def dashboard():
-    # load user's transactions and compute balances
-    transactions = Transaction.query.filter_by(user_id=current_user.id).order_by(Transaction.date).all()
-    total_balance = 0.0
-    for txn in transactions:
-        if txn.txn_type == "Deposit":
-            total_balance += txn.amount
-        else:
-            # Withdrawal and Transfer are treated as outflows here
-            total_balance -= txn.amount
+    # balance comes from the cached SQL aggregate; count is a COUNT(*), no rows loaded
+    total_balance = cached_balance(current_user.id)
+    transactions_count = (
+        db.session.query(func.count(Transaction.id)).filter(Transaction.user_id == current_user.id).scalar()
+    )
 
     metrics = {
         "total_balance": total_balance,
         "customers_count": 50 if current_user.account_type == "merchant" else None,
-        "transactions_count": len(transactions),
+        "transactions_count": transactions_count,
         "loans_total": 8000,
         "savings_total": 3000,
     }
 
     # show only the last 5 transactions on dashboard
-    last5 = transactions[-5:] if transactions else []
-
-    # prepare profile pic URL for template (handles default image too)
-    profile_pic_url = url_for("static", filename=current_user.profile_pic)
+    last5 = (
+        Transaction.query.filter_by(user_id=current_user.id)
+        .order_by(Transaction.date.desc())
+        .limit(5)
+        .all()[::-1]
+    )
 
     return render_template(
         "dashboard.html",
         metrics=metrics,
         transactions=last5,
         account_number=current_user.account_number,
-        profile_pic_url=profile_pic_url,
+        profile_pic_url=current_user.profile_pic_url,
         username=current_user.username or current_user.email,
         account_type=current_user.account_type,
     )
@@ -301,12 +489,11 @@ def dashboard():
 @login_required
 def transactions_page():
     transactions = Transaction.query.filter_by(user_id=current_user.id).order_by(Transaction.date.desc()).all()
-    profile_pic_url = url_for("static", filename=current_user.profile_pic)
     return render_template(
         "transactions.html",
         transactions=transactions,
         account_number=current_user.account_number,
-        profile_pic_url=profile_pic_url,
+        profile_pic_url=current_user.profile_pic_url,
         username=current_user.username or current_user.email,
         account_type=current_user.account_type,
     )
@@ -336,6 +523,7 @@ def deposit():
         txn = Transaction(user_id=current_user.id, txn_type="Deposit", amount=amount, description="Manual deposit")
         db.session.add(txn)
         db.session.commit()
+        invalidate_balance(current_user.id)
         flash("Deposit successful!", "success")
         return redirect(url_for("transactions_page"))
     return render_template("deposit.html")
@@ -351,7 +539,7 @@ def withdraw():
             flash("Invalid amount", "danger")
             return redirect(url_for("withdraw"))
 
-        balance = sum(tx.amount if tx.txn_type == "Deposit" else -tx.amount for tx in current_user.transactions)
+        balance = current_balance(current_user.id)
         if amount > balance:
             flash("Insufficient funds!", "danger")
             return redirect(url_for("withdraw"))
@@ -359,6 +547,7 @@ def withdraw():
         txn = Transaction(user_id=current_user.id, txn_type="Withdrawal", amount=amount, description="Cash withdrawal")
         db.session.add(txn)
         db.session.commit()
+        invalidate_balance(current_user.id)
         flash("Withdrawal successful!", "success")
         return redirect(url_for("transactions_page"))
     return render_template("withdraw.html")
@@ -380,7 +569,7 @@ def transfer():
             flash("Recipient account not found!", "danger")
             return redirect(url_for("transfer"))
 
-        balance = sum(tx.amount if tx.txn_type == "Deposit" else -tx.amount for tx in current_user.transactions)
+        balance = current_balance(current_user.id)
         if amount > balance:
             flash("Insufficient funds!", "danger")
             return redirect(url_for("transfer"))
@@ -400,6 +589,7 @@ def transfer():
         db.session.add(sender_txn)
         db.session.add(recipient_txn)
         db.session.commit()
+        invalidate_balance(current_user.id, recipient.id)
         flash("Transfer successful!", "success")
         return redirect(url_for("transactions_page"))
     return render_template("transfer.html")
@@ -440,12 +630,11 @@ def profile():
         flash("Profile updated successfully!", "success")
         return redirect(url_for("profile"))
 
-    profile_pic_url = url_for("static", filename=current_user.profile_pic)
     return render_template(
         "profile.html",
         user=current_user,
         account_number=current_user.account_number,
-        profile_pic_url=profile_pic_url,
+        profile_pic_url=current_user.profile_pic_url,
         username=current_user.username or current_user.email,
         account_type=current_user.account_type,
     )
@@ -460,15 +649,7 @@ def add_money():
     if request.method == "POST":
         flash("Add money action received (placeholder).", "info")
         return redirect(url_for("dashboard"))
-    return render_template_string("""
-      {% extends "dashboard.html" %}
-      {% block content %}
-      <div class="p-6">
-        <h1 class="text-2xl font-bold">Add Money</h1>
-        <p class="text-gray-600">Placeholder page — implement payment gateway or funding method here.</p>
-      </div>
-      {% endblock %}
-    """)
+    return render_template("placeholder_add_money.html")
 
 @app.route("/bills")
 @login_required
@@ -480,11 +661,6 @@ def bills():
 @app.route("/betting", methods=["GET", "POST"])
 @login_required
 def betting():
-    betting_companies = [
-        "Bet9ja", "NairaBet", "SportyBet", "BetKing", "MerryBet",
-        "1xBet", "SureBet247", "AccessBet", "BetWay", "LivescoreBet"
-    ]
-
     if request.method == "POST":
         company = request.form.get("company")
         account_id = request.form.get("account_id")
@@ -495,10 +671,7 @@ def betting():
             return redirect(url_for("betting"))
 
         # calculate balance from transactions
-        balance = sum(
-            tx.amount if tx.txn_type == "Deposit" else -tx.amount
-            for tx in current_user.transactions
-        )
+        balance = current_balance(current_user.id)
         if amount > balance:
             flash("Insufficient funds to fund betting account.", "danger")
             return redirect(url_for("betting"))
@@ -511,19 +684,18 @@ def betting():
         )
         db.session.add(txn)
         db.session.commit()
+        invalidate_balance(current_user.id)
 
         flash(f"Successfully funded {company} account!", "success")
         return redirect(url_for("transactions_page"))
 
     # render the nice betting page
-    return render_template("betting.html", betting_companies=betting_companies)
+    return render_template("betting.html", betting_companies=BETTING_COMPANIES)
 
 
 @app.route("/internet", methods=["GET", "POST"])
 @login_required
 def internet():
-    providers = ["MTN", "GLO", "AIRTEL", "ETISALAT"]
-
     if request.method == "POST":
         phone_number = request.form.get("phone_number")
         bundle = request.form.get("bundle")
@@ -533,20 +705,27 @@ def internet():
             flash("All fields are required.", "danger")
             return redirect(url_for("internet"))
 
+        match = _AMOUNT_RE.search(bundle)
+        if not match:
+            flash("Invalid bundle.", "danger")
+            return redirect(url_for("internet"))
+        amount = float(match.group(1).replace(",", ""))
+
         # Example logic (adjust with your transaction model)
         txn = Transaction(
             user_id=current_user.id,
             txn_type="Data Purchase",
-            amount=float(bundle.split("₦")[-1].replace(",", "").strip()),
+            amount=amount,
             description=f"Bought {bundle} for {phone_number} on {payment_method}",
         )
         db.session.add(txn)
         db.session.commit()
+        invalidate_balance(current_user.id)
 
         flash(f"Successfully purchased {bundle} for {phone_number}", "success")
         return redirect(url_for("transactions_page"))
 
-    return render_template("internet.html", providers=providers)
+    return render_template("internet.html", providers=INTERNET_PROVIDERS)
 
 
 # Airtime page route
@@ -565,28 +744,12 @@ def education():
 @app.route("/cards")
 @login_required
 def cards():
-    return render_template_string("""
-      {% extends "dashboard.html" %}
-      {% block content %}
-      <div class="p-6">
-        <h1 class="text-2xl font-bold">Cards</h1>
-        <p class="text-gray-600">Card management (placeholder).</p>
-      </div>
-      {% endblock %}
-    """)
+    return render_template("placeholder_cards.html")
 
 @app.route("/more")
 @login_required
 def more():
-    return render_template_string("""
-      {% extends "dashboard.html" %}
-      {% block content %}
-      <div class="p-6">
-        <h1 class="text-2xl font-bold">More</h1>
-        <p class="text-gray-600">Additional services and settings (placeholder).</p>
-      </div>
-      {% endblock %}
-    """)
+    return render_template("placeholder_more.html")
 
 @app.route("/send", methods=["GET", "POST"])
 @login_required
@@ -594,15 +757,7 @@ def send():
     if request.method == "POST":
         flash("Send action received (placeholder).", "info")
         return redirect(url_for("dashboard"))
-    return render_template_string("""
-      {% extends "dashboard.html" %}
-      {% block content %}
-      <div class="p-6">
-        <h1 class="text-2xl font-bold">Send</h1>
-        <p class="text-gray-600">Send money to recipients (placeholder).</p>
-      </div>
-      {% endblock %}
-    """)
+    return render_template("placeholder_send.html")
 
 @app.route("/pay", methods=["GET", "POST"])
 @login_required
@@ -610,15 +765,7 @@ def pay():
     if request.method == "POST":
         flash("Pay action received (placeholder).", "info")
         return redirect(url_for("dashboard"))
-    return render_template_string("""
-      {% extends "dashboard.html" %}
-      {% block content %}
-      <div class="p-6">
-        <h1 class="text-2xl font-bold">Pay</h1>
-        <p class="text-gray-600">Pay bills and merchants (placeholder).</p>
-      </div>
-      {% endblock %}
-    """)
+    return render_template("placeholder_pay.html")
 
 @app.route("/home")
 @login_required
@@ -637,4 +784,7 @@ def logout():
 if __name__ == "__main__":
     with app.app_context():
         db.create_all()
+        # create_all() skips indexes on tables that already exist
+        for index in (*User.__table__.indexes, *Transaction.__table__.indexes):
+            index.create(db.engine, checkfirst=True)
     app.run(debug=True)